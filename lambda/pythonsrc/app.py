@@ -1,16 +1,21 @@
 import os
 import logging
-
-from functions.activities import activities_handler
-from functions.deals import deals_handler
-from functions.owners import owners_handler
-from functions.companies import companies_handler
-from functions.pipelines import pipelines_handler
-from functions.contacts import contacts_handler
+from importlib import import_module
 
 LOG = logging.getLogger()
 LOG.setLevel(logging.INFO)
 
+# Each Lambda runs a single task, so only that task's module (and its
+# pandas/awswrangler/pyarrow import graph) is loaded on cold start
+TASK_HANDLERS = {
+    "activities": ("functions.activities", "activities_handler"),
+    "deals": ("functions.deals", "deals_handler"),
+    "owners": ("functions.owners", "owners_handler"),
+    "companies": ("functions.companies", "companies_handler"),
+    "contacts": ("functions.contacts", "contacts_handler"),
+    "pipelines": ("functions.pipelines", "pipelines_handler"),
+}
+
 
 def handler(event, context):
     """Dispatcher entrypoint. Selects a task based on TASK env var.
@@ -20,16 +25,7 @@ def handler(event, context):
     """
     task = os.environ.get("TASK", None)
     task = task.strip().lower() if task else None
-    if task == "activities":
-        return activities_handler(event, context)
-    if task == "deals":
-        return deals_handler(event, context)
-    if task == "owners":
-        return owners_handler(event, context)
-    if task == "companies":
-        return companies_handler(event, context)
-    if task == "contacts":
-        return contacts_handler(event, context)
-    if task == "pipelines":
-        return pipelines_handler(event, context)
-    raise RuntimeError("Unknown TASK '%s'" % task)
+    if task not in TASK_HANDLERS:
+        raise RuntimeError("Unknown TASK '%s'" % task)
+    module_name, handler_name = TASK_HANDLERS[task]
+    return getattr(import_module(module_name), handler_name)(event, context)
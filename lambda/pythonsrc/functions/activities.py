@@ -1,12 +1,12 @@
 import logging
 import os
-import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 import pandas as pd
 from hubspot_client import get_client
 from helpers.normalization import map_specific_type, extract_metadata
 from helpers.storage import ensure_bucket_env
-from helpers.utils import parse_hs_datetime, pick_date, utc_now_iso
+from helpers.utils import parse_hs_datetime_series, partition_date, pick_date, utc_now_iso
 from helpers.sync_state import get_sync_manager
 
 LOG = logging.getLogger(__name__)
@@ -14,6 +14,18 @@ LOG.setLevel(logging.INFO)
 
 S3_BUCKET = os.environ.get("S3_BUCKET")
 
+ACTIVITY_OBJECTS = ["emails", "calls", "meetings", "tasks", "notes", "communications"]
+
+# Fallback activity_type per object when no channel/direction is present
+ACTIVITY_DEFAULT_TYPE = {
+    "emails": "EMAIL",
+    "calls": "CALL",
+    "meetings": "MEETING",
+    "tasks": "TASK",
+    "notes": "NOTE",
+    "communications": "NOTE",
+}
+
 def activities_handler(_event, _context):
     LOG.info("Running activities ingest")
     ensure_bucket_env()
@@ -60,10 +72,9 @@ def activities_handler(_event, _context):
         ],
     }
 
-    activities: List[Dict[str, Any]] = []
-
     client = get_client()
-    for obj in ["emails", "calls", "meetings", "tasks", "notes", "communications"]:
+
+    def fetch_object(obj: str) -> pd.DataFrame:
         try:
             LOG.info(f"Fetching {obj} from {created_from_date} to {to_date}")
 
@@ -105,8 +116,17 @@ def activities_handler(_event, _context):
             LOG.info(
                 f"Fetched {len(created_activities)} created and {len(modified_activities)} modified {obj}, deduplicated to {len(res)} unique activities"
             )
-
-            converted = []
+            if not res:
+                return pd.DataFrame()
+
+            # Accumulate columns directly instead of one dict per row
+            default_type = ACTIVITY_DEFAULT_TYPE[obj]
+            activity_ids: List[Optional[str]] = []
+            activity_types: List[str] = []
+            owner_ids: List[Optional[str]] = []
+            created_raw: List[Optional[str]] = []
+            last_modified_raw: List[Optional[str]] = []
+            metadata: Dict[str, List[Any]] = {}
             for obj_row in res:
                 props = obj_row.get("properties", {})
                 if obj == "communications":
@@ -116,57 +136,60 @@ def activities_handler(_event, _context):
                 else:
                     type_value = None
 
-                activity_type = map_specific_type(
-                    type_value,
-                    {
-                        "emails": "EMAIL",
-                        "calls": "CALL",
-                        "meetings": "MEETING",
-                        "tasks": "TASK",
-                        "notes": "NOTE",
-                        "communications": "NOTE",
-                    }[obj],
-                )
-
-                converted.append(
-                    {
-                        "activity_id": obj_row.get("id"),
-                        "activity_type": activity_type,
-                        "owner_id": props.get("hubspot_owner_id") or None,
-                        "created_at": parse_hs_datetime(props.get("hs_createdate")),
-                        "last_modified_at": parse_hs_datetime(
-                            props.get("hs_lastmodifieddate") or props.get("hs_createdate")),
-                        **extract_metadata(props, obj),
-                    }
-                )
+                activity_ids.append(obj_row.get("id"))
+                activity_types.append(map_specific_type(type_value, default_type))
+                owner_ids.append(props.get("hubspot_owner_id") or None)
+                created_raw.append(props.get("hs_createdate"))
+                last_modified_raw.append(props.get("hs_lastmodifieddate") or props.get("hs_createdate"))
+                for key, value in extract_metadata(props, obj).items():
+                    metadata.setdefault(key, []).append(value)
+
+            sub_df = pd.DataFrame(
+                {
+                    "activity_id": activity_ids,
+                    "activity_type": activity_types,
+                    "owner_id": owner_ids,
+                    # Parsed once per column rather than per row
+                    "created_at": parse_hs_datetime_series(created_raw),
+                    "last_modified_at": parse_hs_datetime_series(last_modified_raw),
+                    **metadata,
+                }
+            )
 
-            activities.extend(converted)
             LOG.info("Fetched %s items for %s", len(res), obj)
+            return sub_df
         except Exception as e:
             LOG.warning("%s fetch failed: %s", obj, e)
-        time.sleep(0.25)
+            return pd.DataFrame()
+
+    # Objects are independent; fan out and let the client's shared limiter
+    # keep the combined request rate within HubSpot's budget.
+    with ThreadPoolExecutor(max_workers=len(ACTIVITY_OBJECTS)) as executor:
+        frames = [f for f in executor.map(fetch_object, ACTIVITY_OBJECTS) if not f.empty]
 
-    if not activities:
+    if not frames:
         LOG.info("No activities to write")
         # Update sync state even if no data to track that sync ran
         sync_manager.update_sync_state("activities", records_processed=0)
         return {"written": 0}
 
-    df = pd.DataFrame.from_records(activities)
+    # Frames already carry a RangeIndex; concat would only copy a lone frame
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
 
     # Drop rows where created_at could not be parsed
     before = len(df)
-    out_df = df[df["created_at"].notna()]
+    out_df = df[df["created_at"].notna()].copy()
     LOG.info(
         "Filtered %s rows without created_at (kept %s)",
         before - len(out_df),
         len(out_df),
     )
 
-    out_df["dt"] = df["created_at"].dt.strftime("%Y-%m-%d")
+    # Few distinct days per sync; partition_date returns a compact categorical
+    out_df["dt"] = partition_date(out_df["created_at"])
     before = len(out_df)
     out_df = out_df.drop_duplicates(
-        keep="last"
+        subset=["activity_id"], keep="last", ignore_index=True
     )
     LOG.info(
         "Dropped %s duplicate rows (kept %s)",
@@ -174,8 +197,11 @@ def activities_handler(_event, _context):
         len(out_df),
     )
 
-    # Extract date bounds for sync state tracking
-    max_created, max_modified = sync_manager.extract_date_bounds_from_data(out_df)
+    # Extract date bounds for sync state tracking; both columns are already datetime64[UTC]
+    max_created = out_df["created_at"].max()
+    max_modified = out_df["last_modified_at"].max()
+    max_created = max_created.isoformat() if pd.notna(max_created) else None
+    max_modified = max_modified.isoformat() if pd.notna(max_modified) else None
 
     path = f"s3://{S3_BUCKET}/curated/activities/"
 
@@ -184,9 +210,9 @@ def activities_handler(_event, _context):
         df=out_df,
         s3_path=path,
         partition_cols=["dt"],
-        compression="snappy",
         primary_key_col="activity_id",
         parquet_write_mode="overwrite_partitions",
+        is_incremental=sync_state.is_incremental_sync_enabled,
     )
 
     # Update sync state with the latest dates from the processed data
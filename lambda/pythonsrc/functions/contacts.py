@@ -1,10 +1,11 @@
 import logging
 import os
-from typing import Any, Dict, List
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 
-from helpers.utils import parse_hs_datetime, utc_now_iso
+from helpers.utils import parse_hs_datetime_series, partition_date, utc_now_iso
 from hubspot_client import get_client
 from helpers.storage import ensure_bucket_env
 from helpers.sync_state import get_sync_manager
@@ -14,6 +15,7 @@ LOG.setLevel(logging.INFO)
 
 S3_BUCKET = os.environ.get("S3_BUCKET")
 
+
 def contacts_handler(_event, _context):
     """Ingest contacts as a dimension table with basic attributes.
     Output: s3://{bucket}/dim/contacts/
@@ -45,38 +47,21 @@ def contacts_handler(_event, _context):
         # Incremental sync using search API
         LOG.info(f"Performing incremental sync from new:{created_from_date} modified:{modified_from_date} to {to_date}")
 
-        # Dual-fetch strategy: get both created and modified contacts
-        created_contacts: List[Dict[str, Any]] = client.search_between_chunked(
+        # Created-or-modified contacts in one search (OR'ed filterGroups)
+        union_contacts: List[Dict[str, Any]] = client.search_between_chunked_union(
             object_type="contacts",
             properties=props,
-            from_iso=created_from_date,
+            from_isos={"createdate": created_from_date, "lastmodifieddate": modified_from_date},
             to_iso=to_date,
-            search_prop="createdate"
-        )
-
-        modified_contacts: List[Dict[str, Any]] = client.search_between_chunked(
-            object_type="contacts",
-            properties=props,
-            from_iso=modified_from_date,
-            to_iso=to_date,
-            search_prop="lastmodifieddate"
-        )
-
-        # Merge and deduplicate by contact ID (keep the most recent version)
-        contacts_by_id: Dict[str, Dict[str, Any]] = {}
-        for contact in created_contacts + modified_contacts:
-            contact_id = contact.get("id")
-            if contact_id:
-                contacts_by_id[contact_id] = contact
-
-        contacts = list(contacts_by_id.values())
-        LOG.info(
-            f"Fetched {len(created_contacts)} created and {len(modified_contacts)} modified contacts, deduplicated to {len(contacts)} unique contacts"
+            sort_prop="lastmodifieddate",
         )
+        contacts: Iterable[Dict[str, Any]] = union_contacts
+        LOG.info(f"Fetched {len(union_contacts)} created or modified contacts")
     else:
-        # Full scan via GET /crm/v3/objects/contacts with pagination
+        # Full scan via GET /crm/v3/objects/contacts with pagination; pages are
+        # consumed as they arrive so the raw listing is never held in memory
         LOG.info("Performing full sync")
-        contacts: List[Dict[str, Any]] = client.paginated_request(
+        contacts: Iterable[Dict[str, Any]] = chain.from_iterable(client.iter_pages(
             method="GET",
             endpoint="/crm/v3/objects/contacts",
             params={
@@ -85,34 +70,58 @@ def contacts_handler(_event, _context):
                 "archived": "false",
             },
             result_key="results",
-        )
-
-    if not contacts:
+        ))
+
+    # Single pass into per-column lists (no per-row dicts or nested flattening)
+    contact_ids: List[Optional[str]] = []
+    owner_ids: List[Optional[str]] = []
+    firstnames: List[Optional[str]] = []
+    lastnames: List[Optional[str]] = []
+    emails: List[Optional[str]] = []
+    created_raw: List[Optional[str]] = []
+    modified_raw: List[Optional[str]] = []
+    for contact in contacts:
+        p = contact.get("properties") or {}
+        contact_ids.append(contact.get("id"))
+        owner_ids.append(p.get("hubspot_owner_id"))
+        firstnames.append(p.get("firstname"))
+        lastnames.append(p.get("lastname"))
+        emails.append(p.get("email"))
+        created_raw.append(p.get("createdate"))
+        modified_raw.append(p.get("lastmodifieddate"))
+
+    if not contact_ids:
         LOG.info("No contacts to write for dim")
         sync_manager.update_sync_state("contacts", records_processed=0)
         return {"written": 0}
 
-    recs: List[Dict[str, Any]] = []
-    for contact in contacts:
-        p = contact.get("properties", {})
-        recs.append(
-            {
-                "contact_id": contact.get("id"),
-                "owner_id": p.get("hubspot_owner_id"),
-                "firstname": p.get("firstname"),
-                "lastname": p.get("lastname"),
-                "email": p.get("email"),
-                "created_at": parse_hs_datetime(p.get("createdate")),
-                "last_modified_at": parse_hs_datetime(p.get("lastmodifieddate")),
-            }
-        )
-
-    df = pd.DataFrame.from_records(recs)
+    df = pd.DataFrame(
+        {
+            "contact_id": contact_ids,
+            "owner_id": owner_ids,
+            "firstname": firstnames,
+            "lastname": lastnames,
+            "email": emails,
+            "created_at": created_raw,
+            "last_modified_at": modified_raw,
+        }
+    )
+    # Deduplicate by contact ID in pandas; a contact can appear in more than one
+    # date window of the union search, and the later window's row wins
+    df = df[df["contact_id"].notna()].drop_duplicates(subset="contact_id", keep="last")
+    LOG.info(f"Deduplicated {len(contact_ids)} fetched contacts to {len(df)} unique contacts")
+    if df.empty:
+        LOG.info("No contacts with an id to write for dim")
+        sync_manager.update_sync_state("contacts", records_processed=0)
+        return {"written": 0}
+    # Parse the raw epoch-ms/ISO strings once per column instead of per row
+    df["created_at"] = parse_hs_datetime_series(df["created_at"])
+    df["last_modified_at"] = parse_hs_datetime_series(df["last_modified_at"])
 
     # Extract date bounds for sync state tracking
     max_created, max_modified = sync_manager.extract_date_bounds_from_data(df)
 
-    df["dt"] = df["created_at"].dt.strftime("%Y-%m-%d")
+    df["dt"] = partition_date(df["created_at"], unit="M")
     path = f"s3://{S3_BUCKET}/dim/contacts/"
 
     # Use the reusable merge strategy from sync_state manager
@@ -120,7 +129,8 @@ def contacts_handler(_event, _context):
         df=df,
         s3_path=path,
         partition_cols=["dt"],
-        primary_key_col="contact_id"
+        primary_key_col="contact_id",
+        is_incremental=sync_state.is_incremental_sync_enabled
     )
 
     sync_manager.update_sync_state(
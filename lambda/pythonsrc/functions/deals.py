@@ -1,11 +1,12 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from helpers.sync_state import get_sync_manager
 
-from helpers.utils import parse_hs_datetime, utc_now_iso
+from helpers.utils import parse_hs_datetime_series, partition_date, utc_now_iso
 from hubspot_client import get_client
 from helpers.storage import ensure_bucket_env
 
@@ -31,6 +32,15 @@ BASE_PROPS = [
     "closedate",
 ]
 
+# Output column -> stage id whose entry date it holds
+STAGE_COLUMNS = {
+    "op_detected_at": STG["op"],
+    "proposal_prep_at": STG["prep"],
+    "proposal_sent_at": STG["sent"],
+    "closed_won_at": STG["won"],
+    "closed_lost_at": STG["lost"],
+}
+
 STAGE_PROPS: List[str] = []
 for sid in STG.values():
     STAGE_PROPS.extend([f"hs_date_entered_{sid}", f"hs_v2_date_entered_{sid}"])
@@ -45,32 +55,46 @@ SOURCE_PROPS = [
 
 ALL_PROPS = [*BASE_PROPS, *STAGE_PROPS, *SOURCE_PROPS]
 
-
-def _pick_first(*values: Any) -> Any:
-    for v in values:
-        if v not in (None, ""):
-            return v
-    return None
-
-
-def _get_associations_id(associations, association_key: str) -> Optional[str]:
-    """Helper to get the first association ID from a list of associations."""
-    if not associations:
-        return None
-
-    results = associations.get(association_key, {}).get("results", [])
-    if not results:
-        return None
-    # Return the first ID from the results
-    return results[0].get("id")
+_ASSOCIATION_RESULTS = pa.struct(
+    [("results", pa.list_(pa.struct([("id", pa.string())])))]
+)
+# Only the fields read from the GET listing's `associations` payload
+DEAL_ASSOCIATIONS_TYPE = pa.struct(
+    [("companies", _ASSOCIATION_RESULTS), ("contacts", _ASSOCIATION_RESULTS)]
+)
+
+# HubSpot returns every property as a string (or omits it); dates are parsed
+# column-wise after extraction
+DEAL_PROPS_SCHEMA = pa.schema(
+    [(name, pa.string()) for name in dict.fromkeys([*ALL_PROPS, "hs_lastmodifieddate"])]
+)
+
+
+def _blank_to_null(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    return pc.if_else(pc.equal(values, ""), pa.scalar(None, pa.string()), values)
+
+
+def _first_association_ids(associations: pa.StructArray, key: str) -> pa.Array:
+    """First associated object id per deal for `key` (null when there is none)."""
+    results = pc.struct_field(pc.struct_field(associations, key), "results")
+    # list_element rejects empty lists, so pad them with a single null id
+    padded = pc.if_else(
+        pc.greater(pc.list_value_length(results), 0),
+        results,
+        pa.scalar([{"id": None}], type=results.type),
+    )
+    return pc.struct_field(pc.list_element(padded, 0), "id")
 
 
-def _stage_ts(props: Dict[str, Any], code: str) -> Optional[pd.Timestamp]:
+def _stage_ts(props: pa.Table, code: str) -> pa.ChunkedArray:
     """
-    JS precedence: hs_v2_date_entered_* OR hs_date_entered_* (parse ms or ISO)
+    JS precedence: hs_v2_date_entered_* OR hs_date_entered_*, applied
+    column-wise over all deals. Values stay raw (ms or ISO) for the caller to parse.
     """
-    v = props.get(f"hs_v2_date_entered_{code}") or props.get(f"hs_date_entered_{code}")
-    return parse_hs_datetime(v)
+    return pc.coalesce(
+        _blank_to_null(props[f"hs_v2_date_entered_{code}"]),
+        props[f"hs_date_entered_{code}"],
+    )
 
 
 def deals_handler(_event, _context):
@@ -91,39 +115,27 @@ def deals_handler(_event, _context):
     to_date = utc_now_iso()
 
     if sync_state.is_incremental_sync_enabled:
-        # Incremental sync using dual-fetch strategy
+        # Incremental sync via a single created-or-modified search
         LOG.info(f"Performing incremental sync from new:{created_from_date} modified:{modified_from_date} to {to_date}")
 
-        # Fetch newly created deals
-        created_deals: List[Dict[str, Any]] = client.search_between_chunked(
+        # Created-or-modified deals in one search (OR'ed filterGroups); a deal
+        # can still show up in two date windows, so dedup by id
+        union_deals: List[Dict[str, Any]] = client.search_between_chunked_union(
             object_type="deals",
             properties=ALL_PROPS + ["hs_lastmodifieddate", "createdate"],
-            from_iso=created_from_date,
+            from_isos={"createdate": created_from_date, "hs_lastmodifieddate": modified_from_date},
             to_iso=to_date,
-            search_prop="createdate",
-            sort_direction="ASCENDING",
+            sort_prop="hs_lastmodifieddate",
         )
-
-        # Fetch modified deals
-        modified_deals: List[Dict[str, Any]] = client.search_between_chunked(
-            object_type="deals",
-            properties=ALL_PROPS + ["hs_lastmodifieddate", "createdate"],
-            from_iso=modified_from_date,
-            to_iso=to_date,
-            search_prop="hs_lastmodifieddate"
-        )
-
-        # Merge and deduplicate by deal ID (keep the most recent version)
         deals_by_id: Dict[str, Dict[str, Any]] = {}
-        combined_deals = created_deals + modified_deals
-        for deal in combined_deals:
+        for deal in union_deals:
             deal_id = deal.get("id")
             if deal_id:
                 deals_by_id[deal_id] = deal
 
         result = list(deals_by_id.values())
         LOG.info(
-            f"Fetched {len(created_deals)} created and {len(modified_deals)} modified deals, deduplicated to {len(result)} unique deals"
+            f"Fetched {len(union_deals)} created or modified deals, deduplicated to {len(result)} unique deals"
         )
     else:
         # Full sync using paginated request
@@ -143,50 +155,41 @@ def deals_handler(_event, _context):
         sync_manager.update_sync_state("deals", records_processed=0)
         return {"written": 0}
 
-    deals: List[Dict[str, Any]] = []
-    for deal in result:
-        properties = deal.get("properties", {})
-        associations = deal.get("associations", {})
-        company_id = _get_associations_id(associations, "companies")
-        contact_id = _get_associations_id(associations, "contacts")
-        parsed_deal = {
-            "deal_id": deal.get("id"),
-            "deal_name": properties.get("dealname", ""),
-            "owner_id": properties.get("hubspot_owner_id"),
-            "company_id": company_id,
-            "contact_id": contact_id,
-            "deal_stage": properties.get("dealstage"),
-            "created_at": parse_hs_datetime(properties.get("createdate")),
-            "closed_at": parse_hs_datetime(properties.get("closedate")),
-            "last_modified_at": parse_hs_datetime(properties.get("hs_lastmodifieddate")),
-            "amount": properties.get("amount"),
-            # stage dates in ms
-            "op_detected_at": _stage_ts(properties, STG["op"]),
-            "proposal_prep_at": _stage_ts(properties, STG["prep"]),
-            "proposal_sent_at": _stage_ts(properties, STG["sent"]),
-            "closed_won_at": _stage_ts(properties, STG["won"]),
-            "closed_lost_at": _stage_ts(properties, STG["lost"]),
+    # One Arrow table over all property dicts (missing keys become nulls)
+    # replaces per-deal dict lookups
+    props = pa.Table.from_pylist(
+        [deal.get("properties") or {} for deal in result], schema=DEAL_PROPS_SCHEMA
+    )
+    associations = pa.array(
+        [deal.get("associations") or {} for deal in result], type=DEAL_ASSOCIATIONS_TYPE
+    )
+
+    df = pa.table(
+        {
+            "deal_id": pa.array([deal.get("id") for deal in result], pa.string()),
+            "deal_name": pc.fill_null(props["dealname"], ""),
+            "owner_id": props["hubspot_owner_id"],
+            "company_id": _first_association_ids(associations, "companies"),
+            "contact_id": _first_association_ids(associations, "contacts"),
+            "deal_stage": props["dealstage"],
+            "created_at": props["createdate"],
+            "closed_at": props["closedate"],
+            "last_modified_at": props["hs_lastmodifieddate"],
+            "amount": props["amount"],
+            **{col: _stage_ts(props, code) for col, code in STAGE_COLUMNS.items()},
             # sources
-            "source": _pick_first(
-                properties.get("deal_source"),
-                properties.get("source"),
-                properties.get("lead_source"),
-                properties.get("hs_analytics_source"),
-                properties.get("hs_analytics_source_data_1"),
-            )
+            "source": pc.coalesce(*(_blank_to_null(props[name]) for name in SOURCE_PROPS)),
         }
-        deals.append(parsed_deal)
+    ).to_pandas()
+    for col in ("created_at", "closed_at", "last_modified_at", *STAGE_COLUMNS):
+        df[col] = parse_hs_datetime_series(df[col])
 
-    df = pd.DataFrame.from_records(deals)
-    if df.empty:
-        LOG.info("No deals to write after normalization")
-        sync_manager.update_sync_state("deals", records_processed=0)
-        return {"written": 0}
-
-    df["dt"] = df["created_at"].dt.strftime("%Y-%m-%d")
-    out_df = df.drop_duplicates(
-        keep="last"
-    )
+    df["dt"] = partition_date(df["created_at"], unit="M")
+    # Keep the most recently modified row per deal; among equal timestamps the
+    # stable sort keeps fetch order, so the row from the later window wins
+    out_df = df.sort_values(
+        "last_modified_at", kind="stable", na_position="first"
+    ).drop_duplicates(subset=["deal_id"], keep="last")
 
     # Extract date bounds for sync state tracking
     max_created, max_modified = sync_manager.extract_date_bounds_from_data(out_df)
@@ -197,7 +200,8 @@ def deals_handler(_event, _context):
         df=out_df,
         s3_path=path,
         partition_cols=["dt"],
-        primary_key_col="deal_id"
+        primary_key_col="deal_id",
+        is_incremental=sync_state.is_incremental_sync_enabled
     )
 
     sync_manager.update_sync_state(
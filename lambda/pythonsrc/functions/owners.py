@@ -6,6 +6,7 @@ import awswrangler as wr
 import pandas as pd
 
 from hubspot_client import get_client
+from helpers.storage import S3_SESSION
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
@@ -55,7 +56,7 @@ def owners_handler(_event, _context):
 
         # Delete existing data before saving
         try:
-            wr.s3.delete_objects(path=path)
+            wr.s3.delete_objects(path=path, boto3_session=S3_SESSION)
             LOG.info("Deleted existing owners data from %s", path)
         except Exception as e:
             LOG.warning("Could not delete existing data (may not exist): %s", e)
@@ -64,7 +65,8 @@ def owners_handler(_event, _context):
             df=df,
             path=path,
             dataset=True,
-            compression="snappy"
+            compression="snappy",
+            boto3_session=S3_SESSION,
         )
         LOG.info("Wrote %s owners to %s", len(df), path)
         return {"written": int(len(df))}
@@ -6,7 +6,7 @@ import awswrangler as wr
 import pandas as pd
 
 from hubspot_client import get_client
-from helpers.storage import ensure_bucket_env
+from helpers.storage import S3_SESSION, ensure_bucket_env
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
@@ -47,6 +47,12 @@ def pipelines_handler(_event, _context):
 
     df = pd.DataFrame.from_records(rows)
     path = f"s3://{S3_BUCKET}/dim/stage/"
-    wr.s3.to_parquet(df=df, path=path, dataset=True, compression="snappy")
+    wr.s3.to_parquet(
+        df=df,
+        path=path,
+        dataset=True,
+        compression="snappy",
+        boto3_session=S3_SESSION,
+    )
     LOG.info("Wrote %s stage rows to %s", len(df), path)
     return {"written": int(len(df))}
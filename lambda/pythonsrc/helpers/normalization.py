@@ -19,7 +19,7 @@ def normalize_deals(rows: List[Dict[str, Any]]) -> pd.DataFrame:
         )
     df = pd.DataFrame.from_records(records)
     if not df.empty:
-        df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce", utc=True)
+        df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce", utc=True, format="ISO8601")
     return df
 
 
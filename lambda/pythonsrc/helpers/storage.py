@@ -1,22 +1,64 @@
 import logging
 import os
+import uuid
 from datetime import datetime
+from typing import Optional
 
 import awswrangler as wr
+import boto3
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from botocore.config import Config
+from pyarrow import fs as pafs
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
 
 S3_BUCKET = os.environ.get("S3_BUCKET")
 
+# S3 I/O is network-bound, so use more threads than Lambda's 1-2 vCPUs
+S3_IO_THREADS = int(os.environ.get("S3_IO_THREADS", "16"))
+# Upper bound on rows per Parquet object, so each partition is written as a
+# few right-sized files rather than one oversized or many tiny ones
+MAX_ROWS_PER_FILE = 500_000
+
+# One session per container so awswrangler reuses clients and connections
+# across reads/writes instead of building a fresh session per call.
+# Multipart part size is not configurable here: awswrangler uploads Parquet in
+# fixed 5 MiB parts (smaller objects go as a single PUT) and does not use a
+# boto3 TransferConfig, so upload throughput is governed by S3_IO_THREADS and
+# the connection pool size.
+S3_SESSION = boto3.Session()
+wr.config.botocore_config = Config(
+    max_pool_connections=max(64, S3_IO_THREADS * 2),
+    retries={"mode": "adaptive"},
+)
+
 
 def ensure_bucket_env() -> None:
     if not S3_BUCKET:
         raise RuntimeError("S3_BUCKET not set")
 
 
+_S3_FS: Optional[pafs.S3FileSystem] = None
+
+
+def get_s3_filesystem() -> pafs.S3FileSystem:
+    """Container-level pyarrow S3 filesystem (region/credentials from the environment)."""
+    global _S3_FS
+    if _S3_FS is None:
+        _S3_FS = pafs.S3FileSystem()
+    return _S3_FS
+
+
 def write_parquet(df: pd.DataFrame, table: str) -> int:
+    """Append `df` to curated/{table}/ under today's dt partition.
+
+    Writes through pyarrow.dataset directly; for small partitioned appends this
+    avoids awswrangler's per-file overhead. Timestamps are stored as ms like
+    awswrangler does, so Athena reads both the same way.
+    """
     if df.empty:
         LOG.info("No rows to write for table=%s", table)
         return 0
@@ -24,14 +66,25 @@ def write_parquet(df: pd.DataFrame, table: str) -> int:
     dt = datetime.utcnow().strftime("%Y-%m-%d")
     df["dt"] = dt
     path = f"s3://{S3_BUCKET}/curated/{table}/"
-    wr.s3.to_parquet(
-        df=df,
-        path=path,
-        dataset=True,
-        compression="snappy",
-        partition_cols=["dt"],
+    parquet_format = ds.ParquetFileFormat()
+    ds.write_dataset(
+        pa.Table.from_pandas(df, preserve_index=False),
+        base_dir=f"{S3_BUCKET}/curated/{table}",
+        filesystem=get_s3_filesystem(),
+        format=parquet_format,
+        file_options=parquet_format.make_write_options(
+            compression="snappy",
+            coerce_timestamps="ms",
+            allow_truncated_timestamps=True,
+        ),
+        partitioning=["dt"],
+        partitioning_flavor="hive",
+        # Unique per call so repeated writes append rather than overwrite
+        basename_template=f"{uuid.uuid4().hex}-{{i}}.snappy.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_file=MAX_ROWS_PER_FILE,
+        max_rows_per_group=MAX_ROWS_PER_FILE,
+        use_threads=True,
     )
     LOG.info("Wrote %s rows to %s", len(df), path)
     return len(df)
-
-
@@ -9,16 +9,81 @@ This module provides functionality to:
 
 import logging
 import os
-from datetime import datetime, timezone, timedelta
+import time
+from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Optional, Tuple, Dict, Any, List, Literal
+import awswrangler as wr
 import boto3
 import pandas as pd
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from helpers.utils import parse_iso_utc
+from helpers.storage import MAX_ROWS_PER_FILE, S3_IO_THREADS, S3_SESSION
+from helpers.utils import parse_iso_utc, utc_now_iso
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
 
+INCREMENTAL_SYNC_CACHE_TTL_SECONDS = int(os.environ.get("INCREMENTAL_SYNC_CACHE_TTL_SECONDS", "60"))
+SYNC_STATE_CACHE_TTL_SECONDS = int(os.environ.get("SYNC_STATE_CACHE_TTL_SECONDS", "30"))
+# object_type -> (cached_at, item); written through by update_sync_state
+_SYNC_STATE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Created once per container so keep-alive connections survive across
+# managers and warm invocations
+_DYNAMODB = boto3.resource(
+    "dynamodb",
+    config=Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    ),
+)
+# Retried like DynamoDB: a failed flag read falls back to a full sync
+_SSM = boto3.client(
+    "ssm",
+    config=Config(
+        tcp_keepalive=True,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    ),
+)
+
+
+def _max_iso(values: pd.Series) -> Optional[str]:
+    """Latest timestamp in a column as an ISO string, or None if nothing parses."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # Already parsed upstream; no object round-trip
+        latest = values.max()
+        if pd.notna(latest) and latest.tzinfo is None:
+            latest = latest.tz_localize("UTC")
+    elif pd.api.types.is_numeric_dtype(values):
+        # Epoch ms; take the max over int64 and convert only that value
+        epochs = values.dropna().astype("int64")
+        latest = pd.Timestamp(int(epochs.max()), unit="ms", tz="UTC") if len(epochs) else pd.NaT
+    else:
+        latest = pd.to_datetime(values, utc=True, errors="coerce", format="ISO8601").max()
+    return latest.isoformat() if pd.notna(latest) else None
+
+
+def _sync_state_item(
+        object_type: str,
+        synced_at: str,
+        last_created_at: Optional[str] = None,
+        last_modified_at: Optional[str] = None,
+        records_processed: int = 0,
+) -> Dict[str, Any]:
+    item = {
+        "object_type": object_type,
+        "last_sync_at": synced_at,
+        "records_processed": records_processed,
+    }
+
+    if last_created_at:
+        item["last_created_at"] = last_created_at
+    if last_modified_at:
+        item["last_modified_at"] = last_modified_at
+    return item
+
 
 class SyncState:
     def __init__(self, is_incremental_sync_enabled: bool = False, new_records_checkpoint: Optional[datetime] = None,
@@ -32,8 +97,8 @@ class SyncStateManager:
     """Manages sync state for HubSpot data ingestion with incremental sync support."""
 
     def __init__(self):
-        self.dynamodb = boto3.resource("dynamodb")
-        self.ssm = boto3.client("ssm")
+        self.dynamodb = _DYNAMODB
+        self.ssm = _SSM
         self.table_name = os.environ.get("SYNC_STATE_TABLE")
         self.parameter_name = os.environ.get("INCREMENTAL_SYNC_PARAMETER")
         self.start_date_fallback = os.environ.get("START_DATE", "2025-01-01")
@@ -46,23 +111,41 @@ class SyncStateManager:
             )
 
         self.table = self.dynamodb.Table(self.table_name)
+        self._incremental_cache: Optional[Tuple[float, bool]] = None
 
     def is_incremental_sync_enabled(self) -> bool:
-        """Check if incremental sync is enabled via Parameter Store."""
+        """Check if incremental sync is enabled via Parameter Store.
+
+        Successful lookups are cached for INCREMENTAL_SYNC_CACHE_TTL_SECONDS so
+        get_sync_dates and write_with_merge_strategy share one SSM call per run.
+        """
+        if self._incremental_cache is not None:
+            cached_at, enabled = self._incremental_cache
+            if time.monotonic() - cached_at < INCREMENTAL_SYNC_CACHE_TTL_SECONDS:
+                return enabled
         try:
             response = self.ssm.get_parameter(Name=self.parameter_name)
             value = response["Parameter"]["Value"].lower()
-            return value in ("true", "1", "yes", "enabled")
+            enabled = value in ("true", "1", "yes", "enabled")
+            self._incremental_cache = (time.monotonic(), enabled)
+            return enabled
         except ClientError as e:
             LOG.warning(f"Failed to read parameter {self.parameter_name}: {e}")
             return False
 
     def get_sync_state(self, object_type: str) -> Optional[Dict[str, Any]]:
-        """Retrieve sync state for a specific object type."""
+        """Retrieve sync state for a specific object type.
+
+        Items are cached per container for SYNC_STATE_CACHE_TTL_SECONDS.
+        """
+        cached = _SYNC_STATE_CACHE.get(object_type)
+        if cached and time.monotonic() - cached[0] < SYNC_STATE_CACHE_TTL_SECONDS:
+            return dict(cached[1])
         try:
             response = self.table.get_item(Key={"object_type": object_type})
             if "Item" in response:
-                return response["Item"]
+                _SYNC_STATE_CACHE[object_type] = (time.monotonic(), response["Item"])
+                return dict(response["Item"])
             return None
         except ClientError as e:
             LOG.warning(f"Failed to get sync state for {object_type}: {e}")
@@ -74,21 +157,26 @@ class SyncStateManager:
             last_created_at: Optional[str] = None,
             last_modified_at: Optional[str] = None,
             records_processed: int = 0,
+            synced_at: Optional[str] = None,
     ) -> None:
-        """Update sync state for a specific object type."""
-        try:
-            item = {
-                "object_type": object_type,
-                "last_sync_at": datetime.now(timezone.utc).isoformat(),
-                "records_processed": records_processed,
-            }
-
-            if last_created_at:
-                item["last_created_at"] = last_created_at
-            if last_modified_at:
-                item["last_modified_at"] = last_modified_at
+        """Update sync state for a specific object type.
 
+        The stored timestamps are the checkpoint the next incremental run starts
+        from, so call this only after the data write has succeeded; advancing it
+        concurrently with (or before) the write would skip records if the write fails.
+        `synced_at` lets callers stamping several object types share one timestamp
+        (default: now).
+        """
+        try:
+            item = _sync_state_item(
+                object_type,
+                synced_at or utc_now_iso(),
+                last_created_at=last_created_at,
+                last_modified_at=last_modified_at,
+                records_processed=records_processed,
+            )
             self.table.put_item(Item=item)
+            _SYNC_STATE_CACHE[object_type] = (time.monotonic(), item)
             LOG.info(f"Updated sync state for {object_type}")
         except ClientError as e:
             LOG.error(f"Failed to update sync state for {object_type}: {e}")
@@ -165,20 +253,10 @@ class SyncStateManager:
         if df.empty:
             return None, None
 
-        max_created = None
-        max_modified = None
-
-        if "created_at" in df.columns:
-            created_series = pd.to_datetime(df["created_at"], utc=True, errors="coerce")
-            if not created_series.isna().all():
-                max_created = created_series.max().isoformat()
-
-        if "last_modified_at" in df.columns:
-            modified_series = pd.to_datetime(
-                df["last_modified_at"], utc=True, errors="coerce"
-            )
-            if not modified_series.isna().all():
-                max_modified = modified_series.max().isoformat()
+        max_created = _max_iso(df["created_at"]) if "created_at" in df.columns else None
+        max_modified = (
+            _max_iso(df["last_modified_at"]) if "last_modified_at" in df.columns else None
+        )
 
         return max_created, max_modified
 
@@ -188,72 +266,84 @@ class SyncStateManager:
             s3_path: str,
             partition_cols: List[str],
             primary_key_col: str,
-            compression: str = "snappy",
+            compression: str = "zstd",
             parquet_write_mode: Literal["append", "overwrite", "overwrite_partitions"] | None = "overwrite_partitions",
+            max_rows_by_file: Optional[int] = MAX_ROWS_PER_FILE,
+            boto3_session: Optional[boto3.Session] = None,
+            pyarrow_additional_kwargs: Optional[Dict[str, Any]] = None,
+            is_incremental: Optional[bool] = None,
     ) -> None:
         """
         Write DataFrame to S3 using appropriate strategy based on incremental sync setting.
 
         For incremental sync: merges with existing partition data to avoid duplicates.
         For full sync: overwrites all data.
+        Pass `is_incremental` (the flag the fetch was planned with) so the write
+        always matches the fetch; it is looked up only when omitted.
         """
-        import awswrangler as wr
-
-        partition_col = "dt"
-        if self.is_incremental_sync_enabled():
-            # Get unique partitions from new data
+        boto3_session = boto3_session or S3_SESSION
+        if pyarrow_additional_kwargs is None and compression == "zstd":
+            # Merged partitions are read back on every incremental run; zstd-3
+            # is ~2x smaller than snappy at similar decode speed
+            pyarrow_additional_kwargs = {"compression_level": 3}
+        if is_incremental is None:
+            is_incremental = self.is_incremental_sync_enabled()
+        if is_incremental:
+            # Get unique partitions from new data; hive partition values are
+            # compared as strings
             if len(partition_cols) == 1:
+                # Single partition column (most common case)
                 partition_col = partition_cols[0]
-                partitions_to_merge = df[partition_col].unique()
+                partition_values = df[partition_col]
+                if isinstance(partition_values.dtype, pd.CategoricalDtype):
+                    # Categories already hold the distinct keys; drop any left
+                    # unused by filtering/dedup instead of hashing every row
+                    partition_values = partition_values.cat.remove_unused_categories().cat.categories
+                else:
+                    partition_values = partition_values.unique()
+                partitions_to_merge = {str(v) for v in partition_values}
+
+                def partition_filter(partition: Dict[str, str]) -> bool:
+                    return partition[partition_col] in partitions_to_merge
             else:
-                # For multiple partition columns, get unique combinations
-                partitions_to_merge = (
-                    df[partition_cols].drop_duplicates().to_dict("records")
+                # For multiple partition columns, match unique combinations
+                partitions_to_merge = set(
+                    df[partition_cols].drop_duplicates().astype(str).itertuples(index=False, name=None)
                 )
-
-            # Read existing data for these partitions
-            existing_data = []
-
-            if len(partition_cols) == 1:
-                # Single partition column (most common case)
-                for partition_value in partitions_to_merge:
-                    partition_path = f"{s3_path}{partition_col}={partition_value}/"
-                    try:
-                        existing_df = wr.s3.read_parquet(
-                            path=partition_path, dataset=False
-                        )
-                        if not existing_df.empty:
-                            existing_data.append(existing_df)
-                    except Exception:
-                        # Partition doesn't exist yet, skip
-                        pass
-            else:
-                # Multiple partition columns
-                for partition_combo in partitions_to_merge:
-                    partition_parts = [
-                        f"{col}={partition_combo[col]}" for col in partition_cols
-                    ]
-                    partition_path = f"{s3_path}{'/'.join(partition_parts)}/"
-                    try:
-                        existing_df = wr.s3.read_parquet(
-                            path=partition_path, dataset=False
-                        )
-                        if not existing_df.empty:
-                            existing_data.append(existing_df)
-                    except Exception:
-                        # Partition doesn't exist yet, skip
-                        pass
+                partition_key = itemgetter(*partition_cols)
+
+                def partition_filter(partition: Dict[str, str]) -> bool:
+                    return partition_key(partition) in partitions_to_merge
+
+            # Anti-join: keep existing rows whose key is not in the new batch,
+            # then append the batch (new data wins without a hash dedup over
+            # the combined frame). Only the key column is hashed, so doing
+            # this in Arrow would just add a pandas<->Arrow round-trip.
+            # The Index caches its hash table across chunks.
+            new_keys = pd.Index(df[primary_key_col].unique())
+
+            # Scan every affected partition as one dataset (partition columns
+            # are restored from the hive paths), a file at a time, so only the
+            # surviving rows of each chunk are held rather than all of them
+            kept_chunks = []
+            try:
+                for existing_chunk in wr.s3.read_parquet(
+                    path=s3_path,
+                    dataset=True,
+                    partition_filter=partition_filter,
+                    chunked=True,
+                    boto3_session=boto3_session,
+                    use_threads=S3_IO_THREADS,
+                ):
+                    kept = existing_chunk[new_keys.get_indexer(existing_chunk[primary_key_col]) < 0]
+                    if not kept.empty:
+                        kept_chunks.append(kept)
+            except wr.exceptions.NoFilesFound:
+                # Dataset or partitions don't exist yet, skip
+                pass
 
             # Combine existing and new data
-            if existing_data:
-                all_existing_df = pd.concat(existing_data, ignore_index=True)
-                combined_df = pd.concat([all_existing_df, df], ignore_index=True)
-                # Deduplicate by primary key, keeping the latest (most recent data)
-                final_df = combined_df.drop_duplicates(
-                    subset=[primary_key_col], keep="last"
-                )
-            else:
-                final_df = df
+            final_df = pd.concat([*kept_chunks, df], ignore_index=True) if kept_chunks else df
 
             # Write merged data, overwriting the affected partitions
             wr.s3.to_parquet(
@@ -263,6 +353,10 @@ class SyncStateManager:
                 compression=compression,
                 partition_cols=partition_cols,
                 mode=parquet_write_mode,
+                max_rows_by_file=max_rows_by_file,
+                boto3_session=boto3_session,
+                use_threads=S3_IO_THREADS,
+                pyarrow_additional_kwargs=pyarrow_additional_kwargs,
             )
         else:
             # Full sync - simply overwrite everything
@@ -273,9 +367,19 @@ class SyncStateManager:
                 compression=compression,
                 partition_cols=partition_cols,
                 mode=parquet_write_mode,
+                max_rows_by_file=max_rows_by_file,
+                boto3_session=boto3_session,
+                use_threads=S3_IO_THREADS,
+                pyarrow_additional_kwargs=pyarrow_additional_kwargs,
             )
 
 
+_SYNC_MANAGER: Optional[SyncStateManager] = None
+
+
 def get_sync_manager() -> SyncStateManager:
-    """Get a configured SyncStateManager instance."""
-    return SyncStateManager()
+    """Get the container's SyncStateManager, created (and its Table resolved) on first use."""
+    global _SYNC_MANAGER
+    if _SYNC_MANAGER is None:
+        _SYNC_MANAGER = SyncStateManager()
+    return _SYNC_MANAGER
@@ -1,60 +1,195 @@
 import logging
+import math
 import os
+import sys
+import time
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Optional, Any, Union, Iterable, Mapping, Callable, Hashable, Dict, List, TypeVar
 from dateutil.relativedelta import relativedelta
+import numpy as np
 import pandas as pd
 from dateutil.parser import isoparse
 import awswrangler as wr
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:  # optional C parser; stdlib fromisoformat otherwise
+    _ciso_parse = None
+
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
 
 
 def utc_now_iso() -> str:
+    # datetime's C isoformat is faster than hand-formatting time_ns/gmtime
     return datetime.now(timezone.utc).isoformat()
 
+
+def _fromiso(s: str) -> datetime:
+    """ciso8601 when installed, then stdlib (3.11+ accepts "Z"); dateutil only for exotic forms."""
+    if _ciso_parse is not None:
+        try:
+            return _ciso_parse(s)
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return isoparse(s)
+
+
 def parse_iso_utc(s: str) -> datetime:
     """Parse ISO/date-only to an aware UTC datetime."""
-    s = s.strip()
-    if len(s) == 10:  # 'YYYY-MM-DD'
-        return datetime.strptime(s, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    dt = isoparse(s)
+    return _parse_iso_utc(s.strip())
+
+
+# Checkpoints and merge timestamps repeat; datetimes are immutable so cached
+# results can be shared
+@lru_cache(maxsize=4096)
+def _parse_iso_utc(s: str) -> datetime:
+    if len(s) == 10:  # 'YYYY-MM-DD'; sliced directly, no strptime format parsing
+        if s[4] != "-" or s[7] != "-":
+            raise ValueError(f"Invalid date: {s!r}")
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), tzinfo=timezone.utc)
+    dt = _fromiso(s)
+    # "Z"/"+00:00" inputs already come back as timezone.utc
+    if dt.tzinfo is timezone.utc:
+        return dt
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
-def ms(dt_obj: datetime) -> str:
-    # ensure aware UTC before converting to epoch ms
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def epoch_ms(dt_obj: datetime) -> int:
+    # naive means UTC; aware datetimes subtract from the epoch directly, and the
+    # timedelta parts give exact integer ms (no float timestamp round-trip)
     if dt_obj.tzinfo is None:
         dt_obj = dt_obj.replace(tzinfo=timezone.utc)
-    return str(int(dt_obj.astimezone(timezone.utc).timestamp() * 1000))
+    delta = dt_obj - _EPOCH
+    return delta.days * 86_400_000 + delta.seconds * 1000 + delta.microseconds // 1000
+
+
+def ms(dt_obj: datetime) -> str:
+    return str(epoch_ms(dt_obj))
 
 
 def parse_hs_datetime(v: Any) -> Optional[pd.Timestamp]:
     """
-    - If numeric-like -> treat as epoch ms
+    - If numeric-like (optionally negative) -> treat as epoch ms
     - Else try parse ISO
     """
     if v is None or v == "":
         return None
-    sv = str(v)
-    if sv.isdigit():
-        try:
-            return pd.to_datetime(int(sv), unit="ms", utc=True, errors="coerce")
-        except Exception:
-            return None
-    ts = pd.to_datetime(sv, utc=True, errors="coerce")
-    return None if pd.isna(ts) else ts
+    # Numbers are epoch ms already; skip the str() round-trip and digit scan
+    if isinstance(v, (int, np.integer)) and not isinstance(v, bool):
+        return _epoch_ms_timestamp(int(v))
+    if isinstance(v, float):
+        return _epoch_ms_timestamp(int(v)) if math.isfinite(v) else None
+    return _parse_hs_datetime_str(str(v))
 
 
-def read_parquet(path: str) -> Optional[pd.DataFrame]:
+def _epoch_ms_timestamp(epoch_ms: int) -> Optional[pd.Timestamp]:
+    # Integer ns straight into the constructor, no unit conversion
+    try:
+        return pd.Timestamp(epoch_ms * 1_000_000, tz="UTC")
+    except (ValueError, OverflowError):
+        return None
+
+
+# HubSpot timestamps repeat heavily across records; each distinct string is
+# parsed once per container
+@lru_cache(maxsize=100_000)
+def _parse_hs_datetime_str(sv: str) -> Optional[pd.Timestamp]:
+    if sv[1:].isdigit() if sv[:1] == "-" else sv.isdigit():
+        return _epoch_ms_timestamp(int(sv))
+    try:
+        ts = pd.Timestamp(_fromiso(sv))
+    except (ValueError, OverflowError):
+        # Only non-ISO shapes reach here, so an ISO `format=` would never match;
+        # results are already memoized by lru_cache, so `cache=` adds nothing
+        ts = pd.to_datetime(sv, utc=True, errors="coerce")
+        return None if pd.isna(ts) else ts
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+# Epoch-ms bounds of a ns-resolution Timestamp
+_EPOCH_MS_MIN = -(-pd.Timestamp.min.value // 1_000_000)
+_EPOCH_MS_MAX = pd.Timestamp.max.value // 1_000_000
+
+
+def parse_hs_datetime_series(values: Union[pd.Series, Iterable[Any]]) -> pd.Series:
+    """
+    Vectorized `parse_hs_datetime` over a whole column.
+    - Digit-only values (optionally negative, pre-1970) -> epoch ms
+    - Else ISO 8601
+    Unparseable, empty or missing (None/NaN) values become NaT.
+    """
+    s = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype="object")
+    # HubSpot timestamps repeat heavily; parse each distinct value once and
+    # broadcast the result back by position
+    codes, uniques = pd.factorize(s)
+    if len(uniques) == 0:
+        return pd.Series(pd.NaT, index=s.index, dtype="datetime64[ns, UTC]")
+    u = pd.Series(uniques, dtype="object").astype("string")
+    is_epoch = u.str.fullmatch(r"-?\d+").fillna(False).astype(bool)
+    parts = []
+    if is_epoch.any():
+        # Epochs outside the ns Timestamp range become NaT like the scalar
+        # parser; to_datetime(errors="coerce") alone does not catch them
+        epoch_ms = pd.to_numeric(u[is_epoch], errors="coerce")
+        in_range = epoch_ms.between(_EPOCH_MS_MIN, _EPOCH_MS_MAX)
+        # Plain float64 NaN for the rest: a masked array still carries the raw
+        # values, which overflow the unit cast
+        epoch_ms = epoch_ms.where(in_range).to_numpy("float64", na_value=np.nan)
+        epoch = pd.to_datetime(epoch_ms, unit="ms", utc=True)
+        parts.append(pd.Series(epoch, index=in_range.index).astype("datetime64[ns, UTC]"))
+    if not is_epoch.all():
+        iso = pd.to_datetime(u[~is_epoch], utc=True, errors="coerce", format="ISO8601")
+        parts.append(iso.astype("datetime64[ns, UTC]"))
+    parsed = pd.DatetimeIndex(pd.concat(parts).reindex(u.index))
+    # factorize codes None/NaN as -1; take() only fills those when fill_value is
+    # not None, so pass NaT explicitly or they'd read the last unique value
+    return pd.Series(parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=s.index)
+
+
+def partition_date(ts: pd.Series, unit: str = "D") -> pd.Series:
+    """Format a datetime column as `YYYY-MM-DD` (unit="D") or `YYYY-MM` (unit="M")
+    partition keys (NaT -> missing).
+
+    Returned as a categorical: keys are few per batch, so only the distinct
+    days/months are formatted and consumers get the unique set from categories.
     """
-    Read a Parquet file from S3 and return a DataFrame.
+    naive = ts.dt.tz_convert(None) if ts.dt.tz is not None else ts
+    codes, uniques = pd.factorize(naive.to_numpy().astype(f"datetime64[{unit}]"))
+    labels = np.datetime_as_string(uniques, unit=unit)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=labels), index=ts.index)
+
+
+def read_parquet(
+    path: str,
+    columns: Optional[List[str]] = None,
+    partition_filter: Optional[Callable[[Dict[str, str]], bool]] = None,
+    use_threads: Union[bool, int] = True,
+) -> Optional[pd.DataFrame]:
+    """
+    Read a Parquet dataset from S3 and return a DataFrame.
+    Pass the minimal `columns` and a `partition_filter` (called with the
+    partition values as strings) so unused columns and partitions are never
+    fetched.
     """
     try:
-        df = wr.s3.read_parquet(path=path, dataset=True, dtype_backend="pyarrow")
+        df = wr.s3.read_parquet(
+            path=path,
+            dataset=True,
+            dtype_backend="pyarrow",
+            columns=columns,
+            partition_filter=partition_filter,
+            use_threads=use_threads,
+        )
         return df
     except Exception as e:
         LOG.error(f"Failed to read Parquet from {path}: {e}")
@@ -70,7 +205,13 @@ def format_as_hs_datetime(dt: Optional[Union[pd.Timestamp, datetime, str]]) -> O
         dt = dt.to_pydatetime()
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")[:-3] + "Z"
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    # Integer formatting instead of strftime + slice
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T"
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond // 1000:03d}Z"
+    )
 
 
 def pick_date(
@@ -107,9 +248,14 @@ def pick_date(
             parsed_date = parse_iso_utc(env_value)
             return parsed_date.isoformat()
 
-    # 3. Fallback
-    fallback = datetime.now(timezone.utc) - relativedelta(months=fallback_months)
-    return fallback.isoformat()
+    # 3. Fallback (minute resolution, so repeated calls reuse one computation)
+    return _months_ago_iso(int(time.time() // 60), fallback_months)
+
+
+@lru_cache(maxsize=128)
+def _months_ago_iso(epoch_minute: int, months: int) -> str:
+    now = datetime.fromtimestamp(epoch_minute * 60, tz=timezone.utc)
+    return (now - relativedelta(months=months)).isoformat()
 
 
 T = TypeVar("T", bound=Mapping[str, Any])
@@ -137,41 +283,94 @@ def merge_dedupe(
     Returns:
         A list of unique items (order not guaranteed). Convert to dict if needed.
     """
-
-    def get_key(item: T) -> Hashable:
-        return key(item) if callable(key) else item.get(key)
+    # Interned field names let dict lookups on the items hit the identity fast path
+    if isinstance(key, str):
+        key = sys.intern(key)
+    if isinstance(dt_key, str):
+        dt_key = sys.intern(dt_key)
+
+    if resolver is None and dt_key is None and isinstance(key, str):
+        # Last write wins on a field name: inline the lookup, no per-item call
+        latest: Dict[Hashable, T] = {}
+        for it in iterables:
+            for item in it:
+                k = item.get(key)
+                if k is not None:
+                    latest[k] = item
+        return list(latest.values())
+
+    if callable(key):
+        get_key = key
+    else:
+        def get_key(item: T) -> Hashable:
+            return item.get(key)
+
+    if resolver is None and dt_key is not None:
+        return _merge_dedupe_newest(iterables, get_key, dt_key)
 
     items_by_id: Dict[Hashable, T] = {}
-
     for it in iterables:
         for item in it:
             k = get_key(item)
             if k is None:
                 continue  # skip items without a key
 
-            if k not in items_by_id:
-                items_by_id[k] = item
-                continue
-
-            # Conflict resolution
-            if resolver is not None:
+            if resolver is not None and k in items_by_id:
                 items_by_id[k] = resolver(items_by_id[k], item)
-            elif dt_key is not None:
-                prev, curr = items_by_id[k], item
-                # Keep the one with the larger timestamp value
-                curr_dt = curr.get(dt_key)
-                prev_dt = prev.get(dt_key)
-                curr_dt = parse_iso_utc(curr_dt).timestamp() if curr_dt else None
-                prev_dt = parse_iso_utc(prev_dt).timestamp() if prev_dt else None
-                if curr_dt is not None and (prev_dt is None or curr_dt > prev_dt):
-                    items_by_id[k] = curr
             else:
-                # Last write wins
+                # First sighting, or last write wins
                 items_by_id[k] = item
 
     return list(items_by_id.values())
 
 
+_UNPARSED = object()
+
+
+def _merge_dedupe_newest(
+        iterables: Iterable[Iterable[T]],
+        get_key: Callable[[T], Hashable],
+        dt_key: str,
+) -> List[T]:
+    """`merge_dedupe` with dt_key: keep the item with the newest dt_key per key."""
+    # (item, epoch ms of dt_key) per key; the timestamp is parsed lazily on the
+    # first conflict and then compared as an int, so no string is parsed twice
+    entries: Dict[Hashable, tuple] = {}
+    ms_cache: Dict[str, int] = {}
+
+    def get_ms(item: T) -> Optional[int]:
+        raw = item.get(dt_key)
+        if not raw:
+            return None
+        value = ms_cache.get(raw)
+        if value is None:
+            value = ms_cache[raw] = epoch_ms(parse_iso_utc(raw))
+        return value
+
+    for it in iterables:
+        for item in it:
+            k = get_key(item)
+            if k is None:
+                continue  # skip items without a key
+
+            entry = entries.get(k)
+            if entry is None:
+                entries[k] = (item, _UNPARSED)
+                continue
+
+            prev_ms = entry[1]
+            if prev_ms is _UNPARSED:
+                prev_ms = get_ms(entry[0])
+            curr_ms = get_ms(item)
+            # Keep the one with the larger timestamp value
+            if curr_ms is not None and (prev_ms is None or curr_ms > prev_ms):
+                entries[k] = (item, curr_ms)
+            else:
+                entries[k] = (entry[0], prev_ms)
+
+    return [entry[0] for entry in entries.values()]
+
+
 if __name__ == "__main__":
     # Example usage
     now = datetime.now(timezone.utc)
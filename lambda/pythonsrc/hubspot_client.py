@@ -1,13 +1,17 @@
 import os
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
-from helpers.utils import parse_iso_utc
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from helpers.utils import epoch_ms, parse_iso_utc
 
 import boto3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.INFO)
@@ -19,6 +23,31 @@ _CACHED_TOKEN: Optional[str] = None
 _CACHED_AT: float = 0.0
 
 
+def _build_session() -> requests.Session:
+    """Build a pooled keep-alive session with retry/backoff for HubSpot.
+
+    Search endpoints are read-only POSTs, so POST is included in the retryable
+    methods. 429 responses honor the `Retry-After` header.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+# Created once per container so TCP/TLS connections survive across clients
+# and warm invocations.
+_SESSION = _build_session()
+
+
 def _get_hubspot_token() -> str:
     global _CACHED_TOKEN, _CACHED_AT
     env_token = os.environ.get("HUBSPOT_TOKEN")
@@ -46,24 +75,46 @@ def _get_hubspot_token() -> str:
 
 def to_epoch_ms(iso_str: str) -> int:
     try:
-        if len(iso_str) == 10:
-            dt = datetime.strptime(iso_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        else:
-            dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        return int(dt.timestamp() * 1000)
+        # Shares parse_iso_utc's cache with the rest of the package
+        return epoch_ms(parse_iso_utc(iso_str))
     except Exception:
-        return int(datetime.now(timezone.utc).timestamp() * 1000)
+        return epoch_ms(datetime.now(timezone.utc))
+
+
+def _between_group(prop: str, start: datetime, end: datetime) -> Dict[str, Any]:
+    """Search filterGroup matching `prop` between two datetimes (inclusive)."""
+    return {
+        "filters": [{
+            "propertyName": prop,
+            "operator": "BETWEEN",
+            "value": str(epoch_ms(start)),
+            "highValue": str(epoch_ms(end)),
+        }]
+    }
 
 
 class HubSpotClient:
-    def __init__(self, token: Optional[str] = None, rate_limit_pause: float = 0.25):
+    def __init__(self, token: Optional[str] = None, rate_limit_pause: float = 0.2):
+        """:param rate_limit_pause: Minimum spacing between request starts, shared
+        by all threads using this client (0.2s matches the 5 req/s search limit).
+        """
         self.token = token or _get_hubspot_token()
         if not self.token:
             raise RuntimeError("HUBSPOT_TOKEN is not configured.")
         self.base_url = HS_BASE_URL
-        self.session = requests.Session()
+        self.session = _SESSION
         self.rate_limit_pause = rate_limit_pause
-        self._last_req_at: float = 0.0
+        self._next_slot: float = 0.0
+        self._slot_lock = threading.Lock()
+
+    def _throttle(self) -> None:
+        """Reserve the next request slot and sleep until it opens."""
+        with self._slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.rate_limit_pause
+        if slot > now:
+            time.sleep(slot - now)
 
     def request(
             self,
@@ -80,10 +131,7 @@ class HubSpotClient:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
         }
-        now = time.time()
-        elapsed = now - self._last_req_at
-        if elapsed < self.rate_limit_pause:
-            time.sleep(self.rate_limit_pause - elapsed)
+        self._throttle()
         resp = self.session.request(
             method=method,
             url=url,
@@ -94,33 +142,42 @@ class HubSpotClient:
             timeout=timeout,
             **kwargs,
         )
-        self._last_req_at = time.time()
         if not resp.ok:
             raise RuntimeError(f"HubSpot API error {resp.status_code}: {resp.text}")
         return resp.json() if resp.text else {}
 
-    def paginated_request(
+    def iter_pages(
             self,
             method: str,
             endpoint: str,
             params: Optional[Dict[str, Any]] = None,
             result_key: str = "results",
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each page of results from a cursor-paginated endpoint, so callers
+        can process pages as they arrive instead of buffering the whole listing."""
         params = params.copy() if params else {}
         params.setdefault("limit", 100)
-        all_results: List[Dict[str, Any]] = []
         after: Optional[str] = None
         while True:
             if after:
                 params["after"] = after
             data = self.request(method, endpoint, params=params)
-            page = data.get(result_key, [])
-            all_results.extend(page)
+            yield data.get(result_key, [])
             next_page = (data.get("paging") or {}).get("next")
             if not next_page:
                 break
             after = next_page.get("after")
-            time.sleep(self.rate_limit_pause)
+
+    def paginated_request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[Dict[str, Any]] = None,
+            result_key: str = "results",
+    ) -> List[Dict[str, Any]]:
+        all_results: List[Dict[str, Any]] = []
+        for page in self.iter_pages(method, endpoint, params=params, result_key=result_key):
+            all_results.extend(page)
         return all_results
 
     def search_between(
@@ -177,31 +234,18 @@ class HubSpotClient:
             if after:
                 payload["after"] = after
 
-            # backoff on 429
-            base_sleep = 0.5
-            max_retries = 5
-            data = None
-            for attempt in range(max_retries + 1):
-                try:
-                    response = self.request("POST", url, json=payload, timeout=60)
-                    data = response
-                    break
-                except RuntimeError as e:
-                    msg = str(e)
-                    if "429" in msg and attempt < max_retries:
-                        time.sleep(base_sleep * (2 ** attempt))
-                        continue
-                    if "10000" in msg or "10,000" in msg:
-                        LOG.warning(
-                            "Hit 10k results limit for %s; stopping pagination.",
-                            object_type,
-                        )
-                        return out
-                    raise
-            if not data:
-                raise RuntimeError(
-                    f"Failed to fetch data for {object_type} after retries"
-                )
+            # 429/5xx backoff is handled by the session's retry policy
+            try:
+                data = self.request("POST", url, json=payload, timeout=60)
+            except RuntimeError as e:
+                msg = str(e)
+                if "10000" in msg or "10,000" in msg:
+                    LOG.warning(
+                        "Hit 10k results limit for %s; stopping pagination.",
+                        object_type,
+                    )
+                    return out
+                raise
 
             out.extend(data.get("results", []))
             # Stop at 10k results cap
@@ -212,7 +256,6 @@ class HubSpotClient:
             if not next_page:
                 break
             after = next_page.get("after")
-            time.sleep(self.rate_limit_pause)
         return out
 
     def search_between_chunked(
@@ -226,6 +269,7 @@ class HubSpotClient:
             max_total_per_chunk: int = 9500,
             max_days: int = 14,
             min_days: int = 1,
+            max_workers: int = 4,
     ) -> list:
         """Search for objects of a type `object_type` between two ISO timestamps
         using a chunked approach to avoid hitting API limits.
@@ -240,19 +284,99 @@ class HubSpotClient:
         :param max_total_per_chunk: Maximum number of results per chunk (default 9500).
         :param max_days: Maximum number of days to try for each chunk (default 14).
         :param min_days: Minimum number of days to try for each chunk (default 1).
+        :param max_workers: Number of date chunks fetched concurrently (default 4).
+        """
+        return self._search_windows(
+            object_type=object_type,
+            properties=properties,
+            start=parse_iso_utc(from_iso),
+            end=parse_iso_utc(to_iso),
+            filter_groups=lambda s, e: [_between_group(search_prop, s, e)],
+            sort_prop=search_prop,
+            sort_direction=sort_direction,
+            max_total_per_chunk=max_total_per_chunk,
+            max_days=max_days,
+            min_days=min_days,
+            max_workers=max_workers,
+        )
+
+    def search_between_chunked_union(
+            self,
+            object_type: str,
+            properties: list,
+            from_isos: Dict[str, str],
+            to_iso: str,
+            sort_prop: Optional[str] = None,
+            sort_direction: str = "ASCENDING",
+            max_total_per_chunk: int = 9500,
+            max_days: int = 14,
+            min_days: int = 1,
+            max_workers: int = 4,
+    ) -> list:
+        """Search for objects matching any of several date ranges in one query per
+        page, e.g. created since X OR modified since Y.
+        Each property becomes its own filterGroup (HubSpot ORs filterGroups), so
+        the union comes back from a single search instead of one search per
+        property. An object whose properties fall in different date windows can
+        still be returned more than once; callers dedup by id.
+        :param object_type: Type of HubSpot object (e.g., "contacts", "deals").
+        :param properties: List of properties to fetch for each object.
+        :param from_isos: Mapping of search property -> start ISO timestamp (inclusive).
+        :param to_iso: End ISO timestamp (inclusive), shared by all properties.
+        :param sort_prop: Property to sort results by (default the first search property).
+        :param sort_direction: Sort direction, either "ASCENDING" or "DESCENDING".
+        :param max_total_per_chunk: Maximum number of results per chunk (default 9500).
+        :param max_days: Maximum number of days to try for each chunk (default 14).
+        :param min_days: Minimum number of days to try for each chunk (default 1).
+        :param max_workers: Number of date chunks fetched concurrently (default 4).
+        """
+        starts = {prop: parse_iso_utc(iso) for prop, iso in from_isos.items()}
+
+        def filter_groups(window_start: datetime, window_end: datetime) -> List[Dict[str, Any]]:
+            return [
+                _between_group(prop, max(window_start, prop_start), window_end)
+                for prop, prop_start in starts.items()
+                if prop_start < window_end
+            ]
+
+        return self._search_windows(
+            object_type=object_type,
+            properties=properties,
+            start=min(starts.values()),
+            end=parse_iso_utc(to_iso),
+            filter_groups=filter_groups,
+            sort_prop=sort_prop or next(iter(starts)),
+            sort_direction=sort_direction,
+            max_total_per_chunk=max_total_per_chunk,
+            max_days=max_days,
+            min_days=min_days,
+            max_workers=max_workers,
+        )
+
+    def _search_windows(
+            self,
+            object_type: str,
+            properties: list,
+            start: datetime,
+            end: datetime,
+            filter_groups: Callable[[datetime, datetime], List[Dict[str, Any]]],
+            sort_prop: str,
+            sort_direction: str,
+            max_total_per_chunk: int,
+            max_days: int,
+            min_days: int,
+            max_workers: int,
+    ) -> list:
+        """Split [start, end] into date windows whose search total stays below
+        `max_total_per_chunk`, then fetch the windows concurrently.
+        :param filter_groups: Builds the search filterGroups for a window; an empty
+        list means the window has nothing to match and is skipped.
         """
         all_results = []
 
-        def get_total(start, end):
+        def get_total(groups):
             payload = {
-                "filterGroups": [{
-                    "filters": [{
-                        "propertyName": search_prop,
-                        "operator": "BETWEEN",
-                        "value": str(int(start.timestamp() * 1000)),
-                        "highValue": str(int(end.timestamp() * 1000)),
-                    }]
-                }],
+                "filterGroups": groups,
                 "limit": 1,
                 "properties": []
             }
@@ -263,23 +387,16 @@ class HubSpotClient:
             )
             return res.get("total", 0)
 
-        def fetch_chunk(start, end):
+        def fetch_chunk(groups):
             results = []
             after = None
 
             while True:
                 payload = {
-                    "filterGroups": [{
-                        "filters": [{
-                            "propertyName": search_prop,
-                            "operator": "BETWEEN",
-                            "value": str(int(start.timestamp() * 1000)),
-                            "highValue": str(int(end.timestamp() * 1000)),
-                        }]
-                    }],
+                    "filterGroups": groups,
                     "properties": properties,
                     "limit": 100,
-                    "sorts": [{"propertyName": search_prop, "direction": sort_direction}]
+                    "sorts": [{"propertyName": sort_prop, "direction": sort_direction}]
                 }
                 if after:
                     payload["after"] = after
@@ -298,19 +415,21 @@ class HubSpotClient:
 
             return results
 
-        start = parse_iso_utc(from_iso)
-        end = parse_iso_utc(to_iso)
         cursor = start
 
+        # Plan the date windows first (cheap limit=1 count queries), then fetch
+        # them concurrently; each window paginates its own cursor.
+        chunks = []
         while cursor < end:
             try_days = max_days
             while try_days >= min_days:
                 chunk_end = min(cursor + timedelta(days=try_days), end)
-                total = get_total(cursor, chunk_end)
+                groups = filter_groups(cursor, chunk_end)
+                total = get_total(groups) if groups else 0
                 if total < max_total_per_chunk:
                     LOG.info(f"Fetching {total} results for {object_type} from {cursor.date()} to {chunk_end.date()}")
-                    chunk = fetch_chunk(cursor, chunk_end)
-                    all_results.extend(chunk)
+                    if total:
+                        chunks.append(groups)
                     cursor = chunk_end
                     break
                 else:
@@ -320,6 +439,12 @@ class HubSpotClient:
             else:
                 raise RuntimeError(f"Could not reduce chunk below {min_days} days for {cursor}")
 
+        if not chunks:
+            return all_results
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            for chunk in executor.map(fetch_chunk, chunks):
+                all_results.extend(chunk)
+
         return all_results
 
     def batch_read_associations_v4(
@@ -0,0 +1,53 @@
+import math
+
+import pandas as pd
+import pytest
+
+from helpers.utils import parse_hs_datetime, parse_hs_datetime_series
+
+
+def test_parse_hs_datetime_series_mixed_epoch_and_iso_out_of_range():
+    out = parse_hs_datetime_series(
+        ["9999999999999999", "99999999999999999999", "1700000000000", "2024-01-01T00:00:00Z"]
+    )
+
+    assert str(out.dtype) == "datetime64[ns, UTC]"
+    assert out.isna().tolist() == [True, True, False, False]
+    assert out[2] == pd.Timestamp("2023-11-14T22:13:20Z")
+    assert out[3] == pd.Timestamp("2024-01-01T00:00:00Z")
+
+
+def test_parse_hs_datetime_series_missing_values_stay_nat():
+    out = parse_hs_datetime_series(
+        ["1700000000000", None, "2024-03-05T10:00:00Z", float("nan"), ""]
+    )
+
+    assert out.isna().tolist() == [False, True, False, True, True]
+
+
+def test_parse_hs_datetime_series_negative_epoch():
+    out = parse_hs_datetime_series(["-86400000", "2024-01-01T00:00:00Z"])
+
+    assert out[0] == pd.Timestamp("1969-12-31T00:00:00Z")
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["1700000000000", None, "2024-03-05T10:00:00Z", float("nan"), ""],
+        ["-86400000", "0", "1700000000000"],
+        ["9999999999999999", "99999999999999999999", "-9999999999999999"],
+        ["9223372036854", "-9223372036854", "9223372036855"],
+        ["2024-01-01", "2024-01-01T05:00:00+02:00", "not a date", "1700000000000"],
+    ],
+)
+def test_parse_hs_datetime_matches_series(values):
+    out = parse_hs_datetime_series(values)
+
+    assert str(out.dtype) == "datetime64[ns, UTC]"
+    for value, batch in zip(values, out):
+        scalar = parse_hs_datetime(None if isinstance(value, float) and math.isnan(value) else value)
+        if scalar is None:
+            assert pd.isna(batch), value
+        else:
+            assert batch == scalar, value
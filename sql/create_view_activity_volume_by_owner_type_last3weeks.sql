@@ -204,7 +204,7 @@ OR REPLACE VIEW "activity_volume_by_owner_type_last3weeks_v3" AS WITH week_bound
 				AND (
 					(d.dt IS NULL)
 					OR (
-						d.dt BETWEEN date_format(db.start_date, '%Y-%m-%d') AND date_format(db.end_date, '%Y-%m-%d')
+						d.dt BETWEEN date_format(db.start_date, '%Y-%m') AND date_format(db.end_date, '%Y-%m')
 					)
 				)
 			)